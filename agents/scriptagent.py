@@ -1,7 +1,7 @@
 # Agent Definitions
 from crewai import Agent
 from tools.research_tools import research_tools
-from config.llm_config import gemini_llm
+from config.llm_config import get_gemini_llm
 
 class ScriptAgents:
     def __init__(self):
@@ -23,7 +23,7 @@ class ScriptAgents:
             verbose=True,
             allow_delegation=False,
             memory=True,
-            llm=gemini_llm
+            llm=get_gemini_llm()
         )
     
     def _create_outline_agent(self) -> Agent:
@@ -38,7 +38,7 @@ class ScriptAgents:
             verbose=True,
             allow_delegation=False,
             memory=True,
-            llm = gemini_llm
+            llm = get_gemini_llm()
         )
     
     def _create_script_agent(self) -> Agent:
@@ -53,7 +53,7 @@ class ScriptAgents:
             verbose=True,
             allow_delegation=False,
             memory=True,
-            llm = gemini_llm
+            llm = get_gemini_llm()
         )
     
     def _create_qa_agent(self) -> Agent:
@@ -68,5 +68,5 @@ class ScriptAgents:
             verbose=True,
             allow_delegation=False,
             memory=True,
-            llm = gemini_llm
+            llm = get_gemini_llm(streaming=True)
         )
\ No newline at end of file
@@ -0,0 +1,76 @@
+from langchain_core.language_models.chat_models import generate_from_stream
+from langchain_google_genai import ChatGoogleGenerativeAI
+from config.config import GEMINI_MAX_RPM, LLM_CACHE_DIR, LLM_CACHE_TTL
+from config.rate_limit import RateLimiter
+from diskcache import Cache
+import blake3
+import orjson
+import os
+
+
+# Persistent response cache, bypassed with LLM_CACHE_DISABLED=1
+llm_cache = None if os.getenv("LLM_CACHE_DISABLED") == "1" else Cache(LLM_CACHE_DIR)
+
+# Gemini quota is per API key, so every model instance and crew shares one budget
+gemini_limiter = RateLimiter(GEMINI_MAX_RPM, 60)
+
+
+class CachedGemini(ChatGoogleGenerativeAI):
+    """Gemini chat model that serves repeated prompts from the disk cache."""
+
+    # Generate through the token stream so callbacks see tokens as they arrive
+    streaming: bool = False
+
+    def _cache_key(self, messages, stop, kwargs) -> str:
+        # Every setting that changes the request sent to Gemini is part of the key
+        payload = {
+            "model": self.model,
+            "temperature": self.temperature,
+            "max_output_tokens": self.max_output_tokens,
+            "top_p": self.top_p,
+            "top_k": self.top_k,
+            "n": self.n,
+            # Keyed by HarmCategory enums, orjson only takes str keys
+            "safety_settings": {str(k): str(v) for k, v in (self.safety_settings or {}).items()},
+            "convert_system_message_to_human": self.convert_system_message_to_human,
+            "messages": [m.dict() for m in messages],
+            "stop": stop,
+            "kwargs": kwargs
+        }
+        # Only newer langchain-google-genai releases have context caching
+        cached_content = getattr(self, "cached_content", None)
+        if cached_content is not None:
+            payload["cached_content"] = cached_content
+        return blake3.blake3(orjson.dumps(payload, default=str, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        if llm_cache is None:
+            return self._generate_uncached(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+        key = self._cache_key(messages, stop, kwargs)
+        result = llm_cache.get(key)
+        if result is None:
+            result = self._generate_uncached(messages, stop=stop, run_manager=run_manager, **kwargs)
+            llm_cache.set(key, result, expire=LLM_CACHE_TTL)
+        return result
+
+    def _generate_uncached(self, messages, stop=None, run_manager=None, **kwargs):
+        gemini_limiter.acquire()
+        if self.streaming:
+            return generate_from_stream(self._stream(messages, stop=stop, run_manager=run_manager, **kwargs))
+        return super()._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        if llm_cache is None:
+            return await self._agenerate_uncached(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+        key = self._cache_key(messages, stop, kwargs)
+        result = llm_cache.get(key)
+        if result is None:
+            result = await self._agenerate_uncached(messages, stop=stop, run_manager=run_manager, **kwargs)
+            llm_cache.set(key, result, expire=LLM_CACHE_TTL)
+        return result
+
+    async def _agenerate_uncached(self, messages, stop=None, run_manager=None, **kwargs):
+        await gemini_limiter.acquire_async()
+        return await super()._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
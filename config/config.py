@@ -1,2 +1,11 @@
 LLM_TEMPERATURE = 0.5
-LLM_VERBOSE = True
\ No newline at end of file
+LLM_VERBOSE = True
+GEMINI_MODEL = "gemini-1.5-flash"
+GEMINI_MAX_RPM = 60
+BATCH_CONCURRENCY = 4
+LLM_CACHE_DIR = "./.llm_cache"
+LLM_CACHE_TTL = 7 * 24 * 60 * 60
+SEMANTIC_CACHE_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+SEMANTIC_CACHE_THRESHOLD = 0.92
+TRENDS_CACHE_DIR = "./.trends_cache"
+TRENDS_CACHE_TTL = 60 * 60
\ No newline at end of file
@@ -1,15 +1,27 @@
-from langchain_google_genai import ChatGoogleGenerativeAI
 from config.config import *
 from dotenv import load_dotenv
+from functools import lru_cache
+from typing import TYPE_CHECKING
 import os
 
+if TYPE_CHECKING:
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
 
 # Loading the environment
 load_dotenv()
 
-# Creat the Chat Interface
-gemini_llm=ChatGoogleGenerativeAI(model="gemini-1.5-flash",
-                           verbose=LLM_VERBOSE,
-                           temperature=LLM_TEMPERATURE,
-                           google_api_key=os.getenv("GOOGLE_API_KEY"))
+
+# Creat the Chat Interface, langchain is only imported once a model is needed
+@lru_cache(maxsize=None)
+def get_gemini_llm(streaming: bool = False) -> "ChatGoogleGenerativeAI":
+    from config.cached_llm import CachedGemini
+    from config.streaming import FileStreamHandler
+
+    return CachedGemini(model=GEMINI_MODEL,
+                        verbose=LLM_VERBOSE,
+                        temperature=LLM_TEMPERATURE,
+                        streaming=streaming,
+                        callbacks=[FileStreamHandler()] if streaming else None,
+                        google_api_key=os.getenv("GOOGLE_API_KEY"))
 
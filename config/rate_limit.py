@@ -0,0 +1,38 @@
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """Token bucket shared by every thread and event loop in the process.
+
+    Allows max_rate acquisitions per time_period; callers beyond that are
+    queued behind each other instead of failing.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60.0):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._tokens = float(max_rate)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token and return how long the caller has to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            rate = self.max_rate / self.time_period
+            self._tokens = min(self.max_rate, self._tokens + (now - self._updated) * rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / rate
+
+    def acquire(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
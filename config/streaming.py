@@ -0,0 +1,33 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, TextIO
+from langchain_core.callbacks import BaseCallbackHandler
+
+
+# File receiving streamed tokens for the pipeline run in the current context
+_stream_target: ContextVar[Optional[TextIO]] = ContextVar("stream_target", default=None)
+
+
+class FileStreamHandler(BaseCallbackHandler):
+    """Writes every streamed token to the current run's output file as it arrives."""
+
+    def on_llm_new_token(self, token: str, **kwargs) -> None:
+        target = _stream_target.get()
+        if target is not None:
+            target.write(token)
+            target.flush()
+
+
+@contextmanager
+def stream_to_file(path: Optional[str]):
+    """Send tokens streamed inside this block (and threads started from it) to path."""
+    if path is None:
+        yield
+        return
+
+    with open(path, "w") as f:
+        token = _stream_target.set(f)
+        try:
+            yield
+        finally:
+            _stream_target.reset(token)
@@ -1,3 +1,5 @@
+import asyncio
+from config.config import BATCH_CONCURRENCY
 from config.script_config import ScriptConfig
 from pipeline import ScriptCrew
 from datetime import datetime
@@ -17,13 +19,14 @@ if __name__ == "__main__":
     
     # Initialize and run
     crew = ScriptCrew(config)
-    topic = "The impact of AI on small business marketing strategies 2024"
-    final_script = crew.run_pipeline(topic)
+    topics = [
+        "The impact of AI on small business marketing strategies 2024"
+    ]
     
-    # Save output
+    # Output files receive the QA stage as it streams, then the final script
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"script_output_{timestamp}.md"
-    with open(filename, "w") as f:
-        f.write(final_script)
+    filenames = [f"script_output_{timestamp}_{index}.md" for index in range(1, len(topics) + 1)]
+    asyncio.run(crew.run_batch(topics, concurrency=BATCH_CONCURRENCY, output_files=filenames))
     
-    print(f"Script generation complete. Output saved to {filename}")
\ No newline at end of file
+    for filename in filenames:
+        print(f"Script generation complete. Output saved to {filename}")
\ No newline at end of file
@@ -1,7 +1,12 @@
+import asyncio
+from typing import List, Optional
+from config.llm_config import get_gemini_llm
 from config.script_config import ScriptConfig
+from config.streaming import stream_to_file
 from agents.scriptagent import ScriptAgents
 from crewai import Crew
 from crewai.process import Process
+from tasks.research_cache import SemanticResearchCache
 from tasks.tasks import ScriptTasks
 
 # Main Crew Setup
@@ -9,29 +14,98 @@ class ScriptCrew:
     
     def __init__(self, config: ScriptConfig):
         self.config = config
-        self.agents = ScriptAgents()
-        self.tasks = ScriptTasks(config)
-    
-    def run_pipeline(self, topic: str) -> str:
-        # Create tasks
-        research_task = self.tasks.research_task(topic)
-        outline_task = self.tasks.outline_task(research_task.output.raw_output)
-        script_task = self.tasks.script_task(outline_task.output.raw_output, research_task.output.raw_output)
-        qa_task = self.tasks.qa_task(script_task.output.raw_output)
+        self.research_cache = SemanticResearchCache()
+    
+    def _build_crew(self, topic: str, research: Optional[str] = None) -> Crew:
+        # crewai keeps per-run state on its agents, so every crew gets its own
+        # agents and tasks and concurrent crews in run_batch never share them
+        crew_agents = ScriptAgents()
+        crew_tasks = ScriptTasks(self.config, crew_agents)
+        
+        # Create tasks (the sequential process hands each task the previous output)
+        agents = [
+            crew_agents.outline_agent,
+            crew_agents.script_agent,
+            crew_agents.qa_agent
+        ]
+        tasks = [
+            crew_tasks.outline_task(research),
+            crew_tasks.script_task(),
+            crew_tasks.qa_task()
+        ]
+        
+        # A cached brief for a near-identical topic replaces the research stage.
+        # Otherwise research is planned first and the plan runs as one parallel fan-out
+        if research is None:
+            agents.insert(0, crew_agents.research_agent)
+            tasks[:0] = [
+                crew_tasks.research_plan_task(topic),
+                crew_tasks.research_synthesis_task(topic)
+            ]
         
         # Assemble crew
-        crew = Crew(
-            agents=[
-                self.agents.research_agent,
-                self.agents.outline_agent,
-                self.agents.script_agent,
-                self.agents.qa_agent
-            ],
-            tasks=[research_task, outline_task, script_task, qa_task],
+        return Crew(
+            agents=agents,
+            tasks=tasks,
             process=Process.sequential,
             verbose=2
         )
-        
-        # Execute pipeline
-        result = crew.kickoff()
+    
+    def _store_research(self, topic: str, crew: Crew) -> None:
+        # The synthesis task follows the plan and holds the research brief
+        research_output = crew.tasks[1].output
+        if research_output is not None:
+            self.research_cache.store(topic, research_output.raw_output)
+    
+    def _write_output(self, output_file: Optional[str], result: str) -> None:
+        # Replace the streamed QA tokens with the final script
+        if output_file is not None:
+            with open(output_file, "w") as f:
+                f.write(result)
+    
+    def run_pipeline(self, topic: str, output_file: Optional[str] = None) -> str:
+        # Execute pipeline, QA tokens are streamed to output_file while it runs
+        research = self.research_cache.lookup(topic)
+        crew = self._build_crew(topic, research)
+        with stream_to_file(output_file):
+            result = crew.kickoff()
+        if research is None:
+            self._store_research(topic, crew)
+        self._write_output(output_file, result)
         return result
+    
+    async def run_pipeline_async(self, topic: str, output_file: Optional[str] = None,
+                                 research: Optional[str] = None) -> str:
+        if research is None:
+            research = await asyncio.to_thread(self.research_cache.lookup, topic)
+        crew = self._build_crew(topic, research)
+        with stream_to_file(output_file):
+            # crewai 0.30.11 only has a blocking kickoff, run it off the event loop
+            result = await asyncio.to_thread(crew.kickoff)
+        if research is None:
+            await asyncio.to_thread(self._store_research, topic, crew)
+        self._write_output(output_file, result)
+        return result
+    
+    async def run_batch_research(self, topics: List[str], concurrency: int = 4) -> List[str]:
+        # Send every research prompt through the model's batch interface, skipping the tool loop
+        prompts = [ScriptTasks.research_prompt(self.config, topic) for topic in topics]
+        responses = await get_gemini_llm().abatch(prompts, config={"max_concurrency": concurrency})
+        return [response.content for response in responses]
+    
+    async def run_batch(self, topics: List[str], concurrency: int = 4,
+                        output_files: Optional[List[str]] = None,
+                        batch_research: bool = False) -> List[str]:
+        # Cap the number of crews in flight, model calls are paced by the shared Gemini limiter
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def run_one(topic: str, output_file: Optional[str], research: Optional[str]) -> str:
+            async with semaphore:
+                return await self.run_pipeline_async(topic, output_file, research)
+        
+        output_files = output_files or [None] * len(topics)
+        briefs = await self.run_batch_research(topics, concurrency) if batch_research else [None] * len(topics)
+        return await asyncio.gather(*(
+            run_one(topic, output_file, research)
+            for topic, output_file, research in zip(topics, output_files, briefs)
+        ))
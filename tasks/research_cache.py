@@ -0,0 +1,69 @@
+import logging
+import threading
+from typing import List, Optional
+from config.config import SEMANTIC_CACHE_MODEL, SEMANTIC_CACHE_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticResearchCache:
+    """Research briefs looked up by cosine similarity of the topic embedding.
+
+    Needs the optional sentence-transformers and faiss-cpu packages; without
+    them every lookup misses and nothing is stored.
+    """
+
+    def __init__(self, model_name: str = SEMANTIC_CACHE_MODEL, threshold: float = SEMANTIC_CACHE_THRESHOLD):
+        self.model_name = model_name
+        self.threshold = threshold
+        self._model = None
+        self._index = None
+        self._briefs: List[str] = []
+        self._disabled = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> bool:
+        if self._index is None and not self._disabled:
+            try:
+                import faiss
+                from sentence_transformers import SentenceTransformer
+            except ImportError:
+                self._disabled = True
+                return False
+
+            # The cache is optional, a failed model download or index setup only disables it
+            try:
+                self._model = SentenceTransformer(self.model_name)
+                self._index = faiss.IndexFlatIP(self._model.get_sentence_embedding_dimension())
+            except Exception as e:
+                logger.warning("Semantic research cache disabled: %s", e)
+                self._model, self._index = None, None
+                self._disabled = True
+                return False
+        return self._index is not None
+
+    def _embed(self, topic: str):
+        # Normalized vectors make the inner product equal to cosine similarity
+        return self._model.encode([topic], normalize_embeddings=True).astype("float32")
+
+    def lookup(self, topic: str) -> Optional[str]:
+        with self._lock:
+            # Nothing stored yet, a miss that doesn't need the embedding model
+            if not self._briefs or not self._load():
+                return None
+
+            scores, ids = self._index.search(self._embed(topic), 1)
+            if scores[0][0] >= self.threshold:
+                return self._briefs[ids[0][0]]
+            return None
+
+    def store(self, topic: str, brief: str) -> None:
+        if not brief:
+            return
+
+        with self._lock:
+            if not self._load():
+                return
+
+            self._index.add(self._embed(topic))
+            self._briefs.append(brief)
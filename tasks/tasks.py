@@ -1,51 +1,150 @@
+from string import Template
+from typing import ClassVar, Dict, Optional
 from config.script_config import ScriptConfig
 from crewai import Task
 from agents.scriptagent import ScriptAgents
 
-agents = ScriptAgents()
-
 # Task Definitions
 class ScriptTasks:
-    def __init__(self, config: ScriptConfig):
+    _RESEARCH_NOTES: ClassVar[Dict[str, str]] = {
+        "explainer": "Focus on clear, authoritative sources. Prioritize educational content.",
+        "narrative": "Look for compelling stories and case studies.",
+        "persuasive": "Find strong arguments and counterarguments.",
+        "professional": "Prioritize academic and industry sources.",
+        "casual": "Include popular media and informal discussions."
+    }
+    _OUTLINE_NOTES: ClassVar[Dict[str, str]] = {
+        "short": "Be concise. 1 main point with 1-2 supporting points.",
+        "medium": "2-3 main points with 2-3 supporting points each.",
+        "long": "3-5 main points with multiple supporting points and examples."
+    }
+    _SCRIPT_NOTES: ClassVar[Dict[str, str]] = {
+        "beginner": "Use simple language. Define all terms. More examples.",
+        "intermediate": "Balance technical and accessible language.",
+        "advanced": "Can use specialized terminology. Fewer explanations."
+    }
+    # Description templates are parsed once, each call only fills in the topic
+    _RESEARCH_TEMPLATE: ClassVar[Template] = Template(
+        "Conduct comprehensive research on the topic: $topic\n"
+        "Audience: $audience\n"
+        "Key requirements:\n"
+        "- Gather information from at least 3 different sources (web, YouTube, Quora)\n"
+        "- Identify key facts, statistics, and examples\n"
+        "- Note different perspectives on the topic\n"
+        "- Highlight any controversies or debates\n"
+        "- Find recent developments (last 12 months)\n"
+        "Additional notes: $notes"
+    )
+    _RESEARCH_PLAN_TEMPLATE: ClassVar[Template] = Template(
+        "Plan the research on the topic: $topic\n"
+        "Audience: $audience\n"
+        "Key requirements:\n"
+        "- Split the topic into 3-6 independent sub-queries that can run at the same time\n"
+        "- Use the 'serper' tool for web search and the 'trends' tool for Google Trends interest\n"
+        "- Cover key facts, statistics, examples, different perspectives and recent developments\n"
+        "- Do not run any tools yet\n"
+        "Additional notes: $notes"
+    )
+    _RESEARCH_SYNTHESIS_TEMPLATE: ClassVar[Template] = Template(
+        "Execute the research plan from the previous step and synthesize the results "
+        "into a research brief on the topic: $topic\n"
+        "Audience: $audience\n"
+        "Key requirements:\n"
+        "- Run the whole plan with a single call to the Parallel Research Plan Executor, passing the plan JSON unchanged\n"
+        "- Identify key facts, statistics, and examples\n"
+        "- Note different perspectives on the topic\n"
+        "- Highlight any controversies or debates\n"
+        "- Find recent developments (last 12 months)\n"
+        "Additional notes: $notes"
+    )
+    _OUTLINE_TEMPLATE: ClassVar[Template] = Template(
+        "Create a detailed script outline based on the research provided.\n"
+        "Key requirements:\n"
+        "- Structure content for optimal flow and engagement\n"
+        "- Include hooks and transitions\n"
+        "- Balance information with entertainment value\n"
+        "- Adapt structure to $length length\n"
+        "- Use $style style\n"
+        "Additional notes: $notes"
+    )
+    _SCRIPT_TEMPLATE: ClassVar[Template] = Template(
+        "Write a full script based on the outline and research.\n"
+        "Key requirements:\n"
+        "- Write in a $tone tone\n"
+        "- Target $complexity complexity level\n"
+        "- Make it voiceover-friendly with natural pauses\n"
+        "- Include ${examples}examples\n"
+        "- Include ${stats}statistics\n"
+        "Additional notes: $notes"
+    )
+    _RESEARCH_BRIEF_OUTPUT: ClassVar[str] = (
+        "A comprehensive research brief containing:\n"
+        "1. Key facts and information about the topic\n"
+        "2. Relevant statistics and data points\n"
+        "3. Real-world examples and case studies\n"
+        "4. Different perspectives or schools of thought\n"
+        "5. Recent developments and trends\n"
+        "6. Potential gaps in available information\n"
+        "Formatted as a detailed markdown document with sources cited"
+    )
+
+    def __init__(self, config: ScriptConfig, agents: ScriptAgents):
         self.config = config
+        self.agents = agents
+        # Style notes only depend on the config, resolve them once
+        self._research_notes_str = self._RESEARCH_NOTES.get(config.style, "")
+        self._outline_notes_str = self._OUTLINE_NOTES.get(config.length, "")
+        self._script_notes_str = self._SCRIPT_NOTES.get(config.complexity, "")
+        self._research_fields = {"audience": config.target_audience, "notes": self._research_notes_str}
+        # Outline and script descriptions only depend on the config
+        self._outline_description = self._OUTLINE_TEMPLATE.substitute(
+            length=config.length, style=config.style, notes=self._outline_notes_str
+        )
+        self._script_description = self._SCRIPT_TEMPLATE.substitute(
+            tone=config.tone,
+            complexity=config.complexity,
+            examples="" if config.include_examples else "no ",
+            stats="" if config.include_stats else "no ",
+            notes=self._script_notes_str
+        )
+    
+    @classmethod
+    def research_prompt(cls, config: ScriptConfig, topic: str) -> str:
+        """Research task description and expected output as one prompt, no agent needed"""
+        description = cls._RESEARCH_TEMPLATE.substitute(
+            topic=topic, audience=config.target_audience, notes=cls._RESEARCH_NOTES.get(config.style, "")
+        )
+        return f"{description}\n\nExpected output:\n{cls._RESEARCH_BRIEF_OUTPUT}"
     
     def research_task(self, topic: str) -> Task:
         return Task(
-            description=(
-                f"Conduct comprehensive research on the topic: {topic}\n"
-                f"Audience: {self.config.target_audience}\n"
-                f"Key requirements:\n"
-                "- Gather information from at least 3 different sources (web, YouTube, Quora)\n"
-                "- Identify key facts, statistics, and examples\n"
-                "- Note different perspectives on the topic\n"
-                "- Highlight any controversies or debates\n"
-                "- Find recent developments (last 12 months)\n"
-                f"Additional notes: {self._research_style_notes()}"
-            ),
+            description=self._RESEARCH_TEMPLATE.substitute(self._research_fields, topic=topic),
+            expected_output=self._RESEARCH_BRIEF_OUTPUT,
+            agent=self.agents.research_agent
+        )
+    
+    def research_plan_task(self, topic: str) -> Task:
+        return Task(
+            description=self._RESEARCH_PLAN_TEMPLATE.substitute(self._research_fields, topic=topic),
             expected_output=(
-                "A comprehensive research brief containing:\n"
-                "1. Key facts and information about the topic\n"
-                "2. Relevant statistics and data points\n"
-                "3. Real-world examples and case studies\n"
-                "4. Different perspectives or schools of thought\n"
-                "5. Recent developments and trends\n"
-                "6. Potential gaps in available information\n"
-                "Formatted as a detailed markdown document with sources cited"
+                'Only a JSON object of the form {"subqueries": [{"tool": "serper", "q": "..."}, '
+                '{"tool": "trends", "q": "..."}]} with no surrounding text'
             ),
-            agent=agents.research_agent
+            agent=self.agents.research_agent
+        )
+    
+    def research_synthesis_task(self, topic: str) -> Task:
+        return Task(
+            description=self._RESEARCH_SYNTHESIS_TEMPLATE.substitute(self._research_fields, topic=topic),
+            expected_output=self._RESEARCH_BRIEF_OUTPUT,
+            agent=self.agents.research_agent
         )
     
-    def outline_task(self, research_data: str) -> Task:
+    def outline_task(self, research_data: Optional[str] = None) -> Task:
         return Task(
             description=(
-                f"Create a detailed script outline based on the research provided.\n"
-                f"Key requirements:\n"
-                "- Structure content for optimal flow and engagement\n"
-                "- Include hooks and transitions\n"
-                "- Balance information with entertainment value\n"
-                "- Adapt structure to {self.config.length} length\n"
-                "- Use {self.config.style} style\n"
-                f"Additional notes: {self._outline_style_notes()}"
+                self._outline_description
+                + (f"\nResearch brief:\n{research_data}" if research_data else "")
             ),
             expected_output=(
                 "A structured script outline containing:\n"
@@ -57,21 +156,12 @@ class ScriptTasks:
                 "6. Call-to-action (if specified)\n"
                 "Formatted as a hierarchical markdown document"
             ),
-            agent=agents.outline_agent
+            agent=self.agents.outline_agent
         )
     
-    def script_task(self, outline: str, research: str) -> Task:
+    def script_task(self) -> Task:
         return Task(
-            description=(
-                f"Write a full script based on the outline and research.\n"
-                f"Key requirements:\n"
-                "- Write in a {self.config.tone} tone\n"
-                "- Target {self.config.complexity} complexity level\n"
-                "- Make it voiceover-friendly with natural pauses\n"
-                "- Include {'' if self.config.include_examples else 'no '}examples\n"
-                "- Include {'' if self.config.include_stats else 'no '}statistics\n"
-                f"Additional notes: {self._script_style_notes()}"
-            ),
+            description=self._script_description,
             expected_output=(
                 "A complete script with:\n"
                 "1. Natural, conversational language\n"
@@ -82,10 +172,10 @@ class ScriptTasks:
                 "6. Call-to-action (if specified)\n"
                 "Formatted as a professional script with timing estimates"
             ),
-            agent=agents.script_agent
+            agent=self.agents.script_agent
         )
     
-    def qa_task(self, script: str) -> Task:
+    def qa_task(self) -> Task:
         return Task(
             description=(
                 f"Review and optimize the script for production readiness.\n"
@@ -106,31 +196,5 @@ class ScriptTasks:
                 "5. Version history of changes made\n"
                 "Formatted as a clean markdown document with change tracking"
             ),
-            agent=agents.qa_agent
+            agent=self.agents.qa_agent
         )
-    
-    def _research_style_notes(self) -> str:
-        notes = {
-            "explainer": "Focus on clear, authoritative sources. Prioritize educational content.",
-            "narrative": "Look for compelling stories and case studies.",
-            "persuasive": "Find strong arguments and counterarguments.",
-            "professional": "Prioritize academic and industry sources.",
-            "casual": "Include popular media and informal discussions."
-        }
-        return notes.get(self.config.style, "")
-    
-    def _outline_style_notes(self) -> str:
-        notes = {
-            "short": "Be concise. 1 main point with 1-2 supporting points.",
-            "medium": "2-3 main points with 2-3 supporting points each.",
-            "long": "3-5 main points with multiple supporting points and examples."
-        }
-        return notes.get(self.config.length, "")
-    
-    def _script_style_notes(self) -> str:
-        notes = {
-            "beginner": "Use simple language. Define all terms. More examples.",
-            "intermediate": "Balance technical and accessible language.",
-            "advanced": "Can use specialized terminology. Fewer explanations."
-        }
-        return notes.get(self.config.complexity, "")
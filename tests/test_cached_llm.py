@@ -0,0 +1,21 @@
+from langchain_core.messages import HumanMessage
+
+from config.cached_llm import CachedGemini
+
+
+def _key(**settings):
+    llm = CachedGemini(model="gemini-1.5-flash", google_api_key="test-key", **settings)
+    return llm._cache_key([HumanMessage(content="Write a hook about AI")], None, {})
+
+
+def test_cache_key_is_stable():
+    assert _key(temperature=0.5) == _key(temperature=0.5)
+
+
+def test_cache_key_covers_generation_settings():
+    base = _key()
+    assert _key(max_output_tokens=256) != base
+    assert _key(top_p=0.9) != base
+    assert _key(top_k=20) != base
+    assert _key(n=2) != base
+    assert _key(convert_system_message_to_human=True) != base
@@ -0,0 +1,29 @@
+import sys
+import types
+
+from tasks.research_cache import SemanticResearchCache
+
+
+def test_lookup_on_empty_cache_skips_model_load(monkeypatch):
+    def load():
+        raise AssertionError("the embedding model was loaded")
+
+    cache = SemanticResearchCache()
+    monkeypatch.setattr(cache, "_load", load)
+
+    assert cache.lookup("How do black holes form?") is None
+
+
+def test_failed_model_load_disables_cache(monkeypatch):
+    def broken_model(name):
+        raise OSError(f"could not download {name}")
+
+    monkeypatch.setitem(sys.modules, "faiss", types.SimpleNamespace(IndexFlatIP=None))
+    monkeypatch.setitem(sys.modules, "sentence_transformers",
+                        types.SimpleNamespace(SentenceTransformer=broken_model))
+    cache = SemanticResearchCache()
+
+    cache.store("How do black holes form?", "A research brief")
+
+    assert cache._disabled
+    assert cache.lookup("How do black holes form?") is None
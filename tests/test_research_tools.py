@@ -0,0 +1,150 @@
+import io
+
+import numpy as np
+import orjson
+import pandas as pd
+import pytest
+
+from tools import research_tools
+from tools.research_tools import AdvancedGoogleTrendsTool, SerperSearchTool, _dump, _parse_serper_stream
+
+
+class _FakeTrendReq:
+    """Answers the pytrends calls made by AdvancedGoogleTrendsTool with real DataFrames"""
+
+    def __init__(self, topic):
+        self.topic = topic
+
+    def build_payload(self, kw_list, cat=0, timeframe="today 5-y", geo=""):
+        pass
+
+    def interest_over_time(self):
+        return _interest_frame(self.topic)
+
+    def related_topics(self):
+        top = pd.DataFrame({"value": [100, 40], "topic_title": ["Machine learning", "Robots"]})
+        return {self.topic: {"top": top, "rising": None}}
+
+    def related_queries(self):
+        rising = pd.DataFrame({"query": ["ai news", "ai art"], "value": [250, 120]})
+        return {self.topic: {"top": None, "rising": rising}}
+
+    def interest_by_region(self, resolution="COUNTRY", inc_low_vol=False, inc_geo_code=False):
+        index = pd.Index(["United States", "India"], name="geoName")
+        return pd.DataFrame({self.topic: np.array([100, 73], dtype=np.int64)}, index=index)
+
+    def trending_searches(self, pn="united_states"):
+        return pd.DataFrame({0: ["first trend", "second trend"]})
+
+
+def _interest_frame(topic, periods=10, freq="D"):
+    index = pd.date_range("2024-01-01", periods=periods, freq=freq, name="date")
+    values = np.arange(periods, dtype=np.float64) * 10
+    values[2] = np.nan
+    return pd.DataFrame({topic: values, "isPartial": False}, index=index)
+
+
+def test_format_interest_data_uses_string_dates():
+    tool = AdvancedGoogleTrendsTool()
+    summary = tool._format_interest_data(_interest_frame("ai"), "ai")
+
+    assert summary["status"] == "success"
+    assert summary["peak_interest"] == 90
+    assert summary["current_interest"] == 90
+    assert list(summary["data_points"]) == [
+        f"2024-01-{day:02d}T00:00:00" for day in range(4, 11)
+    ]
+    assert all(isinstance(key, str) for key in summary["data_points"])
+
+
+def test_format_interest_data_keeps_hourly_times():
+    tool = AdvancedGoogleTrendsTool()
+    summary = tool._format_interest_data(_interest_frame("ai", periods=8, freq="h"), "ai")
+
+    assert list(summary["data_points"])[-1] == "2024-01-01T07:00:00"
+
+
+def test_format_interest_data_empty_frame():
+    tool = AdvancedGoogleTrendsTool()
+    summary = tool._format_interest_data(pd.DataFrame(), "ai")
+
+    assert summary["status"] == "no_data"
+
+
+def test_interest_summary_dumps_to_json():
+    tool = AdvancedGoogleTrendsTool()
+    summary = tool._format_interest_data(_interest_frame("ai"), "ai")
+
+    assert orjson.loads(_dump(summary))["data_points"]["2024-01-10T00:00:00"] == 90.0
+
+
+def test_trends_tool_payload_dumps_to_json(monkeypatch):
+    monkeypatch.setattr(research_tools, "_get_trends_client", lambda: _FakeTrendReq("ai"))
+    output = AdvancedGoogleTrendsTool()._run("ai", region="US", timeframe="today 3-m")
+
+    result = orjson.loads(output)
+    assert result["interest_summary"]["status"] == "success"
+    assert len(result["interest_summary"]["data_points"]) == 7
+    assert result["related_topics"]["top"][0]["topic_title"] == "Machine learning"
+    assert result["related_queries"]["rising"][1]["query"] == "ai art"
+    assert result["top_regions"] == {"ai": {"United States": 100, "India": 73}}
+    assert result["trending_context"] == ["first trend", "second trend"]
+
+
+def _organic(n):
+    return [
+        {"title": f"Result {i}", "link": f"https://example.com/{i}", "snippet": f"Snippet {i}",
+         "position": i + 1, "sitelinks": [{"title": "About", "link": f"https://example.com/{i}/about"}]}
+        for i in range(n)
+    ]
+
+
+_SEARCH_PAYLOAD = {
+    "searchParameters": {"q": "ai", "gl": "us", "hl": "en", "type": "search", "num": 10},
+    "knowledgeGraph": {"title": "Artificial intelligence", "attributes": {"Field": "Computer science"}},
+    "organic": _organic(12),
+    "peopleAlsoAsk": [{"question": f"Question {i}?", "snippet": f"Answer {i}"} for i in range(3)],
+    "relatedSearches": [{"query": f"ai {i}"} for i in range(8)],
+    "credits": 1
+}
+
+_SEARCH_PAYLOAD_WITHOUT_QUESTIONS = {
+    key: value for key, value in _SEARCH_PAYLOAD.items() if key != "peopleAlsoAsk"
+}
+
+_NEWS_PAYLOAD = {
+    "searchParameters": {"q": "ai", "gl": "us", "hl": "en", "type": "news", "num": 10},
+    "news": [
+        {"title": f"News {i}", "link": f"https://news.example.com/{i}", "snippet": f"Story {i}",
+         "date": "2 hours ago", "source": "Example News", "position": i + 1}
+        for i in range(9)
+    ],
+    "credits": 1
+}
+
+
+@pytest.mark.skipif(research_tools.ijson is None, reason="ijson is not installed")
+@pytest.mark.parametrize("search_type, payload", [
+    ("search", _SEARCH_PAYLOAD),
+    ("search", _SEARCH_PAYLOAD_WITHOUT_QUESTIONS),
+    ("news", _NEWS_PAYLOAD),
+])
+def test_serper_stream_matches_full_parse(search_type, payload):
+    raw = orjson.dumps(payload)
+    tool = SerperSearchTool()
+
+    streamed = _parse_serper_stream(io.BytesIO(raw), search_type, 10)
+
+    assert tool._format_results("ai", search_type, 10, streamed) == \
+        tool._format_results("ai", search_type, 10, orjson.loads(raw))
+
+
+@pytest.mark.skipif(research_tools.ijson is None, reason="ijson is not installed")
+def test_serper_stream_keeps_only_used_entries():
+    data = _parse_serper_stream(io.BytesIO(orjson.dumps(_SEARCH_PAYLOAD)), "search", 4)
+
+    assert [item["title"] for item in data["organic"]] == [f"Result {i}" for i in range(4)]
+    assert data["organic"][0]["sitelinks"] == [{"title": "About", "link": "https://example.com/0/about"}]
+    assert len(data["peopleAlsoAsk"]) == 3
+    assert len(data["relatedSearches"]) == 5
+    assert "knowledgeGraph" not in data
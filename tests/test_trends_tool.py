@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+
+from tools.trends_tool import AdvancedGoogleTrendsAnalyzer, _date_format, _pooled_session
+
+
+def _frame(freq, periods=24):
+    index = pd.date_range("2024-03-01", periods=periods, freq=freq, name="date")
+    values = np.zeros(periods, dtype=np.int64)
+    values[5] = 100
+    return pd.DataFrame({"ai": values}, index=index)
+
+
+def test_date_format_daily_index():
+    assert _date_format(_frame("D").index) == '%Y-%m-%d'
+
+
+def test_date_format_hourly_index():
+    assert _date_format(_frame("h").index) == '%Y-%m-%d %H:%M'
+
+
+def test_peak_periods_keep_hour_for_hourly_data():
+    peaks = AdvancedGoogleTrendsAnalyzer()._find_peak_periods(_frame("h"))
+
+    assert peaks["ai"]["peak_date"] == "2024-03-01 05:00"
+    assert peaks["ai"]["peak_value"] == 100.0
+
+
+def test_peak_periods_daily_data():
+    peaks = AdvancedGoogleTrendsAnalyzer()._find_peak_periods(_frame("D"))
+
+    assert peaks["ai"]["peak_date"] == "2024-03-06"
+
+
+def test_pooled_session_follows_retry_settings():
+    retry = _pooled_session(2, 0.25).get_adapter("https://trends.google.com").max_retries
+
+    assert (retry.total, retry.connect, retry.read) == (2, 2, 2)
+    assert retry.backoff_factor == 0.25
+    assert _pooled_session(2, 0.25) is _pooled_session(2, 0.25)
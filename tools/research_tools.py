@@ -1,21 +1,202 @@
 import os
 import json
+import atexit
+import asyncio
+import re
+import hashlib
+import threading
+import aiohttp
+import numpy as np
+import orjson
 import requests
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Any, ClassVar, Dict, List, Optional
 from dataclasses import dataclass
-from pytrends.request import TrendReq
-from crewai import Agent, Task, Crew, Process
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from crewai_tools.tools.base_tool import BaseTool
 from dotenv import load_dotenv
+try:
+    import ijson
+except ImportError:  # optional, responses are then parsed whole with orjson
+    ijson = None
 import warnings
 warnings.simplefilter(action='ignore', category=FutureWarning)
-from langchain_google_genai import ChatGoogleGenerativeAI
 from dotenv import load_dotenv
 import os
 
 load_dotenv()
 
+# Serper credentials are resolved once, request headers are built from them once
+_SERPER_KEY = os.getenv('SERPER_API_KEY')
+_SERPER_HEADERS = {
+    "X-API-KEY": _SERPER_KEY or "",
+    "Content-Type": "application/json"
+}
+
+# One keep-alive connection pool shared by every HTTP-based research tool.
+# Serper searches are idempotent, so POSTs are retried on rate limits and 5xx.
+# requests already asks for gzip/deflate, and br as well with the pinned Brotli.
+HTTP_TIMEOUT = (3, 10)  # (connect, read) seconds
+_http = requests.Session()
+_http.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset({"GET", "POST"})
+    )
+))
+atexit.register(_http.close)
+
+# Identical Serper queries within the TTL are answered from memory,
+# least recently used entries are evicted first once the cache is full
+SERPER_CACHE_SIZE = 1000
+SERPER_CACHE_TTL = 15 * 60
+_serper_cache = TTLCache(maxsize=SERPER_CACHE_SIZE, ttl=SERPER_CACHE_TTL)
+_serper_cache_lock = threading.Lock()
+_serper_cache_stats = {"hits": 0, "misses": 0}
+
+# Async Serper batches share one aiohttp session and cap in-flight requests
+SERPER_BATCH_CONCURRENCY = 20
+_SERPER_TIMEOUT = aiohttp.ClientTimeout(total=15)
+
+def _serper_cache_key(query: str, search_type: str, num_results: int) -> str:
+    # Queries differing only in case or surrounding whitespace share an entry
+    normalized = f"{search_type}|{num_results}|{query.lower().strip()}"
+    return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+
+def _serper_cache_get(key: str) -> Optional[str]:
+    with _serper_cache_lock:
+        cached = _serper_cache.get(key)
+        _serper_cache_stats["hits" if cached is not None else "misses"] += 1
+        return cached
+
+def _serper_cache_put(key: str, result: str) -> str:
+    # Errors are not cached so the next call retries the search
+    if not result.startswith("Error"):
+        with _serper_cache_lock:
+            _serper_cache[key] = result
+    return result
+
+# One pytrends client (and its Google cookies) reused by every trends lookup.
+# build_payload stores the query on the client, so callers hold _trends_lock
+# from build_payload until the last result is fetched.
+_trends_client = None
+_trends_lock = threading.Lock()
+
+def _get_trends_client():
+    """Shared TrendReq, created on first use; call with _trends_lock held"""
+    global _trends_client
+    if _trends_client is None:
+        from tools.trends_tool import PooledTrendReq
+
+        # Keep-alive comes from the pooled session behind PooledTrendReq
+        _trends_client = PooledTrendReq(hl='en-US', tz=360, timeout=(5, 15), retries=3, backoff_factor=0.5)
+    return _trends_client
+
+def _dump(obj) -> str:
+    """Pretty JSON for tool output; handles numpy scalars, datetimes and non-string keys"""
+    return orjson.dumps(
+        obj,
+        default=str,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    ).decode()
+
+# Most recent Serper outputs mapped to the dicts they were rendered from, so a
+# content analysis of the same string skips parsing it back
+_LAST_RESULTS_SIZE = 8
+_LAST_RESULTS: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_last_results_lock = threading.Lock()
+
+def _remember_result(output: str, result: Dict[str, Any]) -> str:
+    with _last_results_lock:
+        _LAST_RESULTS[output] = result
+        _LAST_RESULTS.move_to_end(output)
+        if len(_LAST_RESULTS) > _LAST_RESULTS_SIZE:
+            _LAST_RESULTS.popitem(last=False)
+    return output
+
+def _recall_result(output: str) -> Optional[Dict[str, Any]]:
+    with _last_results_lock:
+        return _LAST_RESULTS.get(output)
+
+def _fast_records(df, n: Optional[int] = 10) -> List[Dict[str, Any]]:
+    """First n rows (all rows when n is None) as a list of dicts, like to_dict('records')"""
+    # Series.tolist converts a whole column to native Python values at once,
+    # instead of pandas boxing every cell separately
+    head = df if n is None else df.head(n)
+    columns = head.columns.tolist()
+    values = [head[column].tolist() for column in columns]
+    return [dict(zip(columns, row)) for row in zip(*values)]
+
+def _fast_columns(df, n: int = 10) -> Dict[str, Dict[Any, Any]]:
+    """First n rows as {column: {index: value}}, like df.head(n).to_dict()"""
+    head = df.head(n)
+    index = head.index.tolist()
+    return {column: dict(zip(index, head[column].tolist())) for column in head.columns.tolist()}
+
+# Result lists each Serper endpoint returns, with how many entries _format_results
+# reads from each (None meaning num_results). Other endpoints are parsed whole.
+_SERPER_STREAM_LISTS: Dict[str, Dict[str, Optional[int]]] = {
+    "search": {"organic": None, "peopleAlsoAsk": 5, "relatedSearches": 5},
+    "news": {"news": 5},
+}
+
+def _parse_serper_stream(stream, search_type: str, num_results: int) -> Dict[str, Any]:
+    """Incrementally parse a Serper response, keeping only what _format_results reads"""
+    limits = {key: num_results if limit is None else limit
+              for key, limit in _SERPER_STREAM_LISTS[search_type].items()}
+    targets = {f"{key}.item": key for key in limits}
+    data: Dict[str, Any] = {}
+    # Lists whose closing bracket was seen, a short list is complete as well
+    finished = set()
+    builder, building = None, None
+
+    def collected() -> bool:
+        return all(key in finished or len(data.get(key, ())) >= limit for key, limit in limits.items())
+
+    for prefix, event, value in ijson.parse(stream, use_float=True):
+        # Feed every event of the object being built until its closing event
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == building and event in ("end_map", "end_array"):
+                if building == "searchInformation":
+                    data[building] = builder.value
+                else:
+                    data[targets[building]].append(builder.value)
+                builder, building = None, None
+
+                # Nothing left to collect, skip the rest of the payload
+                if collected():
+                    break
+            continue
+
+        if prefix == "searchInformation" and event == "start_map":
+            builder, building = ijson.ObjectBuilder(), prefix
+            builder.event(event, value)
+        elif prefix in limits and event == "end_array":
+            finished.add(prefix)
+            if collected():
+                break
+        elif prefix in targets:
+            items = data.setdefault(targets[prefix], [])
+            if len(items) >= limits[targets[prefix]]:
+                continue
+            if event in ("start_map", "start_array"):
+                builder, building = ijson.ObjectBuilder(), prefix
+                builder.event(event, value)
+            else:
+                items.append(value)
+
+    return data
+
 @dataclass
 class ResearchInput:
     """Structured input for the research agent"""
@@ -43,23 +224,39 @@ class AdvancedGoogleTrendsTool(BaseTool):
 
     def _run(self, topic: str, region: str = "US", timeframe: str = "now 7-d") -> str:
         try:
-            pytrends = TrendReq(hl='en-US', tz=360, timeout=(10, 25))
-            
-            # Main topic analysis
-            pytrends.build_payload([topic], cat=0, timeframe=timeframe, geo=region)
-            
-            # Get interest over time
-            interest_data = pytrends.interest_over_time()
-            
-            # Get related topics and queries
-            related_topics = pytrends.related_topics()
-            related_queries = pytrends.related_queries()
-            
-            # Get regional interest
-            regional_interest = pytrends.interest_by_region(resolution='COUNTRY', inc_low_vol=True, inc_geo_code=False)
+            # Every Google request shares the trends tool's token bucket and 429 backoff
+            from tools.trends_tool import _rate_limited
             
-            # Get trending searches
-            trending_searches = pytrends.trending_searches(pn=region.lower())
+            with _trends_lock:
+                pytrends = _get_trends_client()
+                
+                # Main topic analysis
+                _rate_limited(pytrends.build_payload, [topic], cat=0, timeframe=timeframe, geo=region)
+                
+                # The lookups below only read the payload built above and share the
+                # client's pooled HTTP session, so they can run side by side. Each
+                # request is bounded by the client's own timeout, and the lock stays
+                # held until all of them are done with the payload
+                with ThreadPoolExecutor(max_workers=5) as executor:
+                    # Get interest over time
+                    interest_future = executor.submit(_rate_limited, pytrends.interest_over_time)
+                    
+                    # Get related topics and queries
+                    related_topics_future = executor.submit(_rate_limited, pytrends.related_topics)
+                    related_queries_future = executor.submit(_rate_limited, pytrends.related_queries)
+                    
+                    # Get regional interest
+                    regional_future = executor.submit(_rate_limited, pytrends.interest_by_region,
+                                                      resolution='COUNTRY', inc_low_vol=True, inc_geo_code=False)
+                    
+                    # Get trending searches
+                    trending_future = executor.submit(_rate_limited, pytrends.trending_searches, pn=region.lower())
+                    
+                    interest_data = interest_future.result()
+                    related_topics = related_topics_future.result()
+                    related_queries = related_queries_future.result()
+                    regional_interest = regional_future.result()
+                    trending_searches = trending_future.result()
             
             # Format results
             result = {
@@ -71,10 +268,10 @@ class AdvancedGoogleTrendsTool(BaseTool):
                 "related_topics": self._format_related_data(related_topics, topic),
                 "related_queries": self._format_related_data(related_queries, topic),
                 "top_regions": self._format_regional_data(regional_interest),
-                "trending_context": trending_searches.head(10).values.flatten().tolist() if not trending_searches.empty else []
+                "trending_context": trending_searches.to_numpy().ravel()[:10].tolist() if not trending_searches.empty else []
             }
             
-            return json.dumps(result, indent=2)
+            return _dump(result)
             
         except Exception as e:
             return f"Error in Google Trends analysis: {str(e)}"
@@ -83,17 +280,25 @@ class AdvancedGoogleTrendsTool(BaseTool):
         if data.empty:
             return {"status": "no_data", "message": f"No trend data found for {topic}"}
         
-        topic_data = data[topic].dropna()
-        if topic_data.empty:
+        # Work on plain numpy arrays: one NaN mask, then cheap scalar reads
+        series = data[topic]
+        values = series.to_numpy(dtype=np.float64)
+        mask = ~np.isnan(values)
+        values = values[mask]
+        if values.size == 0:
             return {"status": "no_data", "message": f"No valid data points for {topic}"}
         
+        current = values[-1]
+        # orjson only serializes str keys, so the Timestamp index is formatted here
+        recent_dates = series.index[mask][-7:].strftime('%Y-%m-%dT%H:%M:%S').tolist()
+        
         return {
             "status": "success",
-            "peak_interest": int(topic_data.max()),
-            "current_interest": int(topic_data.iloc[-1]),
-            "average_interest": round(topic_data.mean(), 2),
-            "trend_direction": "rising" if topic_data.iloc[-1] > topic_data.iloc[-3] else "declining",
-            "data_points": topic_data.tail(7).to_dict()
+            "peak_interest": int(values.max()),
+            "current_interest": int(current),
+            "average_interest": round(float(values.mean()), 2),
+            "trend_direction": "rising" if values.size >= 3 and current > values[-3] else "declining",
+            "data_points": dict(zip(recent_dates, series.to_numpy()[mask][-7:].tolist()))
         }
     
     def _format_related_data(self, data, topic):
@@ -103,10 +308,10 @@ class AdvancedGoogleTrendsTool(BaseTool):
         result = {"top": [], "rising": []}
         
         if data[topic].get('top') is not None:
-            result["top"] = data[topic]['top'].head(10).to_dict('records')
+            result["top"] = _fast_records(data[topic]['top'])
         
         if data[topic].get('rising') is not None:
-            result["rising"] = data[topic]['rising'].head(10).to_dict('records')
+            result["rising"] = _fast_records(data[topic]['rising'])
         
         return result
     
@@ -114,7 +319,7 @@ class AdvancedGoogleTrendsTool(BaseTool):
         if data.empty:
             return []
         
-        return data.head(10).to_dict()
+        return _fast_columns(data)
 
 class SerperSearchTool(BaseTool):
     name: str = "Serper Google Search Tool"
@@ -128,89 +333,187 @@ class SerperSearchTool(BaseTool):
     """
     
     def _run(self, query: str, search_type: str = "search", num_results: int = 10) -> str:
+        key = _serper_cache_key(query, search_type, num_results)
+        cached = _serper_cache_get(key)
+        if cached is not None:
+            return cached
+
+        return _serper_cache_put(key, self._search(query, search_type, num_results))
+
+    async def _arun(self, query: str, search_type: str = "search", num_results: int = 10,
+                    session: Optional[aiohttp.ClientSession] = None) -> str:
+        key = _serper_cache_key(query, search_type, num_results)
+        cached = _serper_cache_get(key)
+        if cached is not None:
+            return cached
+
+        if session is None:
+            async with aiohttp.ClientSession(timeout=_SERPER_TIMEOUT) as session:
+                return await self._arun(query, search_type, num_results, session)
+
+        return _serper_cache_put(key, await self._asearch(session, query, search_type, num_results))
+
+    async def run_batch(self, queries: List[str], search_type: str = "search", num_results: int = 10) -> List[str]:
+        """Run many searches concurrently over one shared aiohttp session"""
+        semaphore = asyncio.Semaphore(SERPER_BATCH_CONCURRENCY)
+
+        async with aiohttp.ClientSession(timeout=_SERPER_TIMEOUT) as session:
+            async def search_one(query: str) -> str:
+                async with semaphore:
+                    return await self._arun(query, search_type, num_results, session)
+
+            return await asyncio.gather(*(search_one(query) for query in queries))
+
+    @staticmethod
+    def cache_stats() -> Dict[str, Any]:
+        """Hit/miss counters of the shared Serper response cache"""
+        with _serper_cache_lock:
+            hits, misses = _serper_cache_stats["hits"], _serper_cache_stats["misses"]
+            size = len(_serper_cache)
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / total if total else 0.0,
+            "size": size
+        }
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop every cached Serper response and reset the counters"""
+        with _serper_cache_lock:
+            _serper_cache.clear()
+            _serper_cache_stats["hits"] = _serper_cache_stats["misses"] = 0
+
+    def _request(self, query: str, search_type: str, num_results: int):
+        """URL, headers and payload of a Serper request, None when no API key is configured"""
+        if not _SERPER_KEY:
+            return None
+        
+        url = f"https://google.serper.dev/{search_type}"
+        
+        payload = {
+            "q": query,
+            "num": num_results,
+            "gl": "us",  # geolocation
+            "hl": "en"   # language
+        }
+        
+        return url, _SERPER_HEADERS, payload
+
+    def _search(self, query: str, search_type: str, num_results: int) -> str:
         try:
-            # Get API key from environment
-            api_key = os.getenv('SERPER_API_KEY')
-            if not api_key:
+            request = self._request(query, search_type, num_results)
+            if request is None:
                 return "Error: SERPER_API_KEY environment variable is required"
+            url, headers, payload = request
             
-            url = f"https://google.serper.dev/{search_type}"
-            
-            payload = {
-                "q": query,
-                "num": num_results,
-                "gl": "us",  # geolocation
-                "hl": "en"   # language
-            }
-            
-            headers = {
-                "X-API-KEY": api_key,
-                "Content-Type": "application/json"
-            }
-            
-            response = requests.post(url, headers=headers, json=payload)
-            response.raise_for_status()
-            
-            data = response.json()
+            with _http.post(url, headers=headers, json=payload, timeout=HTTP_TIMEOUT, stream=True) as response:
+                response.raise_for_status()
+                if ijson is not None and search_type in _SERPER_STREAM_LISTS:
+                    response.raw.decode_content = True
+                    data = _parse_serper_stream(response.raw, search_type, num_results)
+                    # Read off whatever the parser skipped so the connection goes back to the pool
+                    response.raw.drain_conn()
+                else:
+                    data = orjson.loads(response.content)
             
-            # Format the response for better readability
-            formatted_result = {
-                "query": query,
-                "search_type": search_type,
-                "total_results": data.get("searchInformation", {}).get("totalResults", "Unknown"),
-                "results": []
-            }
-            
-            # Process organic results
-            if "organic" in data:
-                for result in data["organic"][:num_results]:
-                    formatted_result["results"].append({
-                        "title": result.get("title", ""),
-                        "link": result.get("link", ""),
-                        "snippet": result.get("snippet", ""),
-                        "date": result.get("date", "")
-                    })
-            
-            # Add news results if available
-            if "news" in data:
-                formatted_result["news"] = []
-                for news in data["news"][:5]:
-                    formatted_result["news"].append({
-                        "title": news.get("title", ""),
-                        "link": news.get("link", ""),
-                        "snippet": news.get("snippet", ""),
-                        "date": news.get("date", ""),
-                        "source": news.get("source", "")
-                    })
+            return self._format_results(query, search_type, num_results, data)
             
-            # Add related searches
-            if "relatedSearches" in data:
-                formatted_result["related_searches"] = [
-                    item.get("query", "") for item in data["relatedSearches"][:5]
-                ]
+        except Exception as e:
+            return f"Error in Serper search: {str(e)}"
+
+    async def _asearch(self, session: aiohttp.ClientSession, query: str, search_type: str, num_results: int) -> str:
+        try:
+            request = self._request(query, search_type, num_results)
+            if request is None:
+                return "Error: SERPER_API_KEY environment variable is required"
+            url, headers, payload = request
             
-            # Add people also ask
-            if "peopleAlsoAsk" in data:
-                formatted_result["people_also_ask"] = [
-                    {
-                        "question": item.get("question", ""),
-                        "snippet": item.get("snippet", "")
-                    } for item in data["peopleAlsoAsk"][:5]
-                ]
+            async with session.post(url, headers=headers, json=payload) as response:
+                response.raise_for_status()
+                data = orjson.loads(await response.read())
             
-            return json.dumps(formatted_result, indent=2)
+            return self._format_results(query, search_type, num_results, data)
             
         except Exception as e:
             return f"Error in Serper search: {str(e)}"
 
+    def _format_results(self, query: str, search_type: str, num_results: int, data: Dict[str, Any]) -> str:
+        # Format the response for better readability
+        formatted_result = {
+            "query": query,
+            "search_type": search_type,
+            "total_results": data.get("searchInformation", {}).get("totalResults", "Unknown"),
+            "results": []
+        }
+        
+        # Process organic results
+        if "organic" in data:
+            for result in data["organic"][:num_results]:
+                formatted_result["results"].append({
+                    "title": result.get("title", ""),
+                    "link": result.get("link", ""),
+                    "snippet": result.get("snippet", ""),
+                    "date": result.get("date", "")
+                })
+        
+        # Add news results if available
+        if "news" in data:
+            formatted_result["news"] = []
+            for news in data["news"][:5]:
+                formatted_result["news"].append({
+                    "title": news.get("title", ""),
+                    "link": news.get("link", ""),
+                    "snippet": news.get("snippet", ""),
+                    "date": news.get("date", ""),
+                    "source": news.get("source", "")
+                })
+        
+        # Add related searches
+        if "relatedSearches" in data:
+            formatted_result["related_searches"] = [
+                item.get("query", "") for item in data["relatedSearches"][:5]
+            ]
+        
+        # Add people also ask
+        if "peopleAlsoAsk" in data:
+            formatted_result["people_also_ask"] = [
+                {
+                    "question": item.get("question", ""),
+                    "snippet": item.get("snippet", "")
+                } for item in data["peopleAlsoAsk"][:5]
+            ]
+        
+        return _remember_result(_dump(formatted_result), formatted_result)
+
+def _keyword_pattern(keywords) -> re.Pattern:
+    """Case-insensitive pattern matching any of the keywords as a substring"""
+    return re.compile("|".join(re.escape(keyword) for keyword in sorted(keywords)), re.IGNORECASE)
+
 class ContentAnalysisTool(BaseTool):
     name: str = "Content Analysis Tool"
     description: str = "Analyzes content structure, statistics, and provides insights for script writing"
+
+    # Title keywords per content bucket, checked in this order
+    _TUTORIAL_KEYWORDS: ClassVar[frozenset] = frozenset({"how to", "guide", "tutorial"})
+    _STATISTICS_KEYWORDS: ClassVar[frozenset] = frozenset({"statistics", "facts", "data"})
+    _TRENDING_KEYWORDS: ClassVar[frozenset] = frozenset({"trend", "latest", "new"})
+
+    _TUTORIAL_PATTERN: ClassVar[re.Pattern] = _keyword_pattern(_TUTORIAL_KEYWORDS)
+    _STATISTICS_PATTERN: ClassVar[re.Pattern] = _keyword_pattern(_STATISTICS_KEYWORDS)
+    _TRENDING_PATTERN: ClassVar[re.Pattern] = _keyword_pattern(_TRENDING_KEYWORDS)
+
+    # Results categorised per call
+    _MAX_RESULTS: ClassVar[int] = 5
     
     def _run(self, research_data: str, topic: str) -> str:
         try:
             # Parse the research data
-            data = json.loads(research_data) if isinstance(research_data, str) else research_data
+            if isinstance(research_data, str):
+                data = _recall_result(research_data) or orjson.loads(research_data)
+            else:
+                data = research_data
             
             analysis = {
                 "topic": topic,
@@ -223,17 +526,7 @@ class ContentAnalysisTool(BaseTool):
             
             # Extract content angles from search results
             if "results" in data:
-                for result in data["results"][:5]:
-                    title = result.get("title", "")
-                    snippet = result.get("snippet", "")
-                    
-                    # Extract potential content angles
-                    if any(keyword in title.lower() for keyword in ["how to", "guide", "tutorial"]):
-                        analysis["content_angles"].append(f"Tutorial: {title}")
-                    elif any(keyword in title.lower() for keyword in ["statistics", "facts", "data"]):
-                        analysis["key_statistics"].append(snippet)
-                    elif any(keyword in title.lower() for keyword in ["trend", "latest", "new"]):
-                        analysis["trending_aspects"].append(title)
+                self._categorize(data["results"][:self._MAX_RESULTS], analysis)
             
             # Extract questions for audience engagement
             if "people_also_ask" in data:
@@ -250,45 +543,112 @@ class ContentAnalysisTool(BaseTool):
                 "Use regional interest data to tailor content"
             ]
             
-            return json.dumps(analysis, indent=2)
+            return _dump(analysis)
             
         except Exception as e:
             return f"Error in content analysis: {str(e)}"
 
-def create_research_crew(research_input: ResearchInput):
-    """Create a specialized research crew for YouTube content"""
-    
-    # Initialize tools
-    trends_tool = AdvancedGoogleTrendsTool() # second this
-    search_tool = SerperSearchTool()   # first this
-    analysis_tool = ContentAnalysisTool() # last
+    def _categorize(self, results, analysis):
+        """Sort search results into tutorial, statistics and trending buckets"""
+        for result in results:
+            title = result.get("title", "")
+            snippet = result.get("snippet", "")
+            
+            # Extract potential content angles
+            if self._TUTORIAL_PATTERN.search(title):
+                analysis["content_angles"].append(f"Tutorial: {title}")
+            elif self._STATISTICS_PATTERN.search(title):
+                analysis["key_statistics"].append(snippet)
+            elif self._TRENDING_PATTERN.search(title):
+                analysis["trending_aspects"].append(title)
 
-    gemini_llm=ChatGoogleGenerativeAI(model="gemini-2.5-flash",
-                            verbose=True,
-                            temperature=0.5,
-                            google_api_key=os.getenv("GOOGLE_API_KEY"))
+async def _gather_sections(calls) -> str:
+    """Run blocking tool calls concurrently and join their results into labelled sections"""
+    # Every source is network-bound, so run them side by side
+    results = await asyncio.gather(
+        *(asyncio.to_thread(run, *args) for _, run, args in calls),
+        return_exceptions=True
+    )
 
+    sections = []
+    for (label, _, _), result in zip(calls, results):
+        if isinstance(result, Exception):
+            result = f"Error in {label}: {str(result)}"
+        sections.append(f"## {label}\n{result}")
 
-    # Define the researcher agent
-    researcher = Agent(
-        role='Senior Content Researcher',
-        goal=f'Conduct comprehensive research on "{research_input.topic}" to create data-driven, engaging YouTube content',
-        backstory="""You are an expert content researcher specializing in YouTube video creation. 
+    return "\n\n".join(sections)
+
+class BatchResearchTool(BaseTool):
+    name: str = "Batch Research Tool"
+    description: str = """
+    Runs the Google Trends analysis, the Serper Google search and the Serper
+    news search for a topic concurrently and returns all results in a single response.
+    """
+
+    def _run(self, topic: str, region: str = "US", timeframe: str = "now 7-d") -> str:
+        trends_tool = AdvancedGoogleTrendsTool()
+        search_tool = SerperSearchTool()
+
+        return asyncio.run(_gather_sections([
+            ("Google Trends", trends_tool._run, (topic, region, timeframe)),
+            ("Serper Search", search_tool._run, (topic,)),
+            ("Serper News", search_tool._run, (topic, "news"))
+        ]))
+
+class ParallelPlanTool(BaseTool):
+    name: str = "Parallel Research Plan Executor"
+    description: str = """
+    Executes a whole research plan in one call, running every sub-query concurrently.
+    The plan is a JSON object such as
+    {"subqueries": [{"tool": "serper", "q": "..."}, {"tool": "trends", "q": "..."}]}
+    where tool is "serper" (Google search) or "trends" (Google Trends analysis).
+    """
+
+    def _run(self, plan: str) -> str:
+        try:
+            # Agents often wrap the plan in a markdown code fence
+            plan = plan.strip().removeprefix("```json").removeprefix("```").removesuffix("```")
+            subqueries = json.loads(plan)["subqueries"]
+        except (ValueError, KeyError, TypeError) as e:
+            return f"Error in research plan: {str(e)}"
+
+        runners = {
+            "serper": SerperSearchTool()._run,
+            "trends": AdvancedGoogleTrendsTool()._run
+        }
+
+        calls = []
+        for subquery in subqueries:
+            if not isinstance(subquery, dict):
+                continue
+            tool, query = subquery.get("tool"), subquery.get("q")
+            if tool in runners and query:
+                calls.append((f"{tool}: {query}", runners[tool], (query,)))
+
+        if not calls:
+            return "Error in research plan: no runnable sub-queries"
+
+        return asyncio.run(_gather_sections(calls))
+
+# Tools shared by the script research agent
+research_tools = [BatchResearchTool(), ParallelPlanTool()]
+
+# Researcher prompt pieces that are the same for every topic, defined once
+# here; each crew still sends them in full with its per-topic text.
+RESEARCH_MODEL = "gemini-2.5-flash"
+RESEARCH_TEMPERATURE = 0.3
+RESEARCH_MAX_OUTPUT_TOKENS = 2048
+
+_RESEARCHER_BACKSTORY = """You are an expert content researcher specializing in YouTube video creation. 
         You have deep knowledge of trending topics, audience psychology, and data-driven content strategy. 
-        You excel at finding unique angles, compelling statistics, and audience engagement opportunities.""",
-        tools=[trends_tool, search_tool, analysis_tool],
-        verbose=True,
-        llm=gemini_llm,
-        allow_delegation=False
-    )
-    
-    # Define the research task
-    research_task = Task(
-        description=f"""
-        Conduct comprehensive research for a YouTube video on "{research_input.topic}". 
+        You excel at finding unique angles, compelling statistics, and audience engagement opportunities."""
+
+_RESEARCH_INSTRUCTIONS = """
+        Gather the trends, search and news data with a single Batch Research Tool call
+        for the topic and region, then analyse it.
         
         Your research should include:
-        1. Google Trends analysis for the topic in {research_input.region}
+        1. Google Trends analysis for the topic in the target region
         2. Current search trends and related queries
         3. Recent news and developments
         4. Audience questions and interests
@@ -296,10 +656,6 @@ def create_research_crew(research_input: ResearchInput):
         6. Content angle recommendations
         7. Competitor analysis (if requested)
         
-        Target audience: {research_input.target_audience}
-        Video style: {research_input.video_style}
-        Duration: {research_input.duration_preference}
-        
         Focus on finding:
         - Trending aspects that can hook viewers
         - Credible statistics and data points
@@ -308,8 +664,9 @@ def create_research_crew(research_input: ResearchInput):
         - Regional preferences and interests
         
         Provide actionable insights for script writing.
-        """,
-        expected_output="""
+        """
+
+_RESEARCH_EXPECTED_OUTPUT = """
         A comprehensive research report containing:
         1. Executive Summary with key findings
         2. Trend Analysis with current interest levels
@@ -318,7 +675,55 @@ def create_research_crew(research_input: ResearchInput):
         5. Statistical Evidence with credible data
         6. Script Framework with suggested structure
         7. SEO Recommendations with keyword opportunities
-        """,
+        """
+
+@lru_cache(maxsize=None)
+def _research_llm():
+    """Researcher LLM, built once so every crew reuses the same Gemini client"""
+    from langchain_core.callbacks import StreamingStdOutCallbackHandler
+    from config.cached_llm import CachedGemini
+
+    # Stream the report to stdout as it is generated, capped to a bounded length
+    return CachedGemini(model=RESEARCH_MODEL,
+                        verbose=True,
+                        temperature=RESEARCH_TEMPERATURE,
+                        max_output_tokens=RESEARCH_MAX_OUTPUT_TOKENS,
+                        streaming=True,
+                        callbacks=[StreamingStdOutCallbackHandler()],
+                        google_api_key=os.getenv("GOOGLE_API_KEY"))
+
+def create_research_crew(research_input: ResearchInput):
+    """Create a specialized research crew for YouTube content"""
+    from crewai import Agent, Task, Crew, Process
+    
+    # Initialize tools, trends + search + news are fetched together in one call
+    batch_tool = BatchResearchTool()
+    analysis_tool = ContentAnalysisTool() # last
+
+    gemini_llm = _research_llm()
+
+    # Define the researcher agent
+    researcher = Agent(
+        role='Senior Content Researcher',
+        goal=f'Conduct comprehensive research on "{research_input.topic}" to create data-driven, engaging YouTube content',
+        backstory=_RESEARCHER_BACKSTORY,
+        tools=[batch_tool, analysis_tool],
+        verbose=True,
+        llm=gemini_llm,
+        allow_delegation=False
+    )
+    
+    # Define the research task, only this header changes between topics
+    research_task = Task(
+        description=f"""
+        Conduct comprehensive research for a YouTube video on "{research_input.topic}". 
+        
+        Target region: {research_input.region}
+        Target audience: {research_input.target_audience}
+        Video style: {research_input.video_style}
+        Duration: {research_input.duration_preference}
+        """ + _RESEARCH_INSTRUCTIONS,
+        expected_output=_RESEARCH_EXPECTED_OUTPUT,
         agent=researcher
     )
     
@@ -337,7 +742,7 @@ def main():
     """Main function to demonstrate the research agent"""
     
     # Check for required environment variables
-    if not os.getenv('SERPER_API_KEY'):
+    if not _SERPER_KEY:
         print("⚠️  SERPER_API_KEY not found in environment variables.")
         print("   Creating .env file template...")
         
@@ -2,13 +2,264 @@ from crewai_tools import BaseTool
 from typing import Type, Dict, List, Optional, Union, Any
 from pydantic import BaseModel, Field
 import pytrends
+from pytrends import exceptions
 from pytrends.request import TrendReq
+from requests import status_codes
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from cachetools import TTLCache
+from diskcache import Cache
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from config.config import TRENDS_CACHE_DIR, TRENDS_CACHE_TTL
+from config.rate_limit import RateLimiter
+import numpy as np
 import pandas as pd
+import requests
+import atexit
+import copy
+import hashlib
+import os
 import json
+import orjson
 from datetime import datetime, timedelta
+import threading
 import time
 import logging
 
+logger = logging.getLogger(__name__)
+
+# Google Trends requests share one token bucket, so concurrent reports only
+# wait when the per-second quota is actually used up
+REQUESTS_PER_SECOND = 5
+MAX_CONCURRENT_REQUESTS = 4
+_limiter = RateLimiter(REQUESTS_PER_SECOND, 1.0)
+
+# Extra wait before each request once Google starts answering 429: doubled on
+# every throttled response up to the cap, halved again on every success
+PENALTY_START = 2.0
+PENALTY_MAX = 30.0
+_penalty = 0.0
+_penalty_lock = threading.Lock()
+
+def _rate_limited(fetch, *args, **kwargs):
+    """Call a pytrends request once the rate limiter hands out a token."""
+    global _penalty
+    _limiter.acquire()
+    
+    with _penalty_lock:
+        delay = _penalty
+    if delay > 0:
+        time.sleep(delay)
+    
+    try:
+        result = fetch(*args, **kwargs)
+    except exceptions.TooManyRequestsError:
+        with _penalty_lock:
+            _penalty = min(PENALTY_MAX, max(PENALTY_START, _penalty * 2))
+        raise
+    
+    with _penalty_lock:
+        _penalty = _penalty / 2 if _penalty >= PENALTY_START / 2 else 0.0
+    return result
+
+# Keep-alive pools for Google Trends requests, one per retry policy. Stock
+# pytrends opens a new session, and so a new TLS connection, for each call.
+@lru_cache(maxsize=None)
+def _pooled_session(retries: int, backoff_factor: float) -> requests.Session:
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        # Same policy stock pytrends builds from retries/backoff_factor, with the
+        # urllib3 2 allowed_methods argument in place of method_whitelist
+        max_retries=Retry(
+            total=retries,
+            read=retries,
+            connect=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=TrendReq.ERROR_CODES,
+            allowed_methods=frozenset(["GET", "POST"]),
+            # Hand the final error response back so a 429 surfaces as TooManyRequestsError
+            raise_on_status=False
+        )
+    ))
+    atexit.register(session.close)
+    return session
+
+class PooledTrendReq(TrendReq):
+    """TrendReq that reuses a keep-alive session matching its retries and backoff_factor."""
+
+    def _get_data(self, url, method=TrendReq.GET_METHOD, trim_chars=0, **kwargs):
+        session = _pooled_session(self.retries, self.backoff_factor)
+        request_args = dict(self.requests_args)
+        if len(self.proxies) > 0:
+            # Rotating proxies need a fresh cookie for the proxy in use, as in stock pytrends
+            self.cookies = self.GetGoogleCookie()
+            request_args.setdefault("proxies", {'https': self.proxies[self.proxy_index]})
+
+        if method == TrendReq.POST_METHOD:
+            response = session.post(url, timeout=self.timeout, cookies=self.cookies,
+                                    headers=self.headers, **kwargs, **request_args)
+        else:
+            response = session.get(url, timeout=self.timeout, cookies=self.cookies,
+                                   headers=self.headers, **kwargs, **request_args)
+
+        # Google answers with any of these content types for JSON payloads
+        content_type = response.headers.get('Content-Type', '')
+        if response.status_code == 200 and any(
+                kind in content_type for kind in ('application/json', 'application/javascript', 'text/javascript')):
+            # Move on to the next proxy after every successful request
+            self.GetNewProxy()
+            # Some responses start with garbage characters like ")]}'," that must be trimmed
+            return json.loads(response.text[trim_chars:])
+
+        if response.status_code == status_codes.codes.too_many_requests:
+            raise exceptions.TooManyRequestsError.from_response(response)
+        raise exceptions.ResponseError.from_response(response)
+
+# The analyzer reuses one client, build_payload stores the query on it so a
+# whole analysis runs under _client_lock
+_client = None
+_client_lock = threading.Lock()
+
+def _get_client() -> PooledTrendReq:
+    """Shared PooledTrendReq, created on first use; call with _client_lock held."""
+    global _client
+    if _client is None:
+        _client = PooledTrendReq(hl='en-US', tz=360, retries=3, backoff_factor=0.5)
+    return _client
+
+def _dump(obj) -> str:
+    """Render an analysis as compact JSON; numpy arrays and scalars are written natively."""
+    # No indentation: the reader is an agent, and the padding roughly doubled the string
+    return orjson.dumps(obj, default=str, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+def _date_format(index) -> str:
+    """strftime format for a trends index: dates for daily data, minutes for hourly 'now' timeframes."""
+    if isinstance(index, pd.DatetimeIndex) and (index != index.normalize()).any():
+        return '%Y-%m-%d %H:%M'
+    return '%Y-%m-%d'
+
+# Finished analyses are reused for identical queries within the TTL
+RESULT_CACHE_SIZE = 256
+RESULT_CACHE_TTL = 10 * 60
+_result_cache = TTLCache(maxsize=RESULT_CACHE_SIZE, ttl=RESULT_CACHE_TTL)
+_result_cache_lock = threading.Lock()
+_cache_stats = {"hits": 0, "misses": 0}
+
+# Analyses also persist on disk across restarts, bypassed with TRENDS_CACHE_DISABLED=1.
+# Date ranges that ended in the past never change and are kept without expiry.
+_disk_cache = None if os.getenv("TRENDS_CACHE_DISABLED") == "1" else Cache(TRENDS_CACHE_DIR)
+
+# Sections whose presence makes one analysis richer than another
+_DATA_SECTIONS = ("interest_over_time", "related_topics", "related_queries", "regional_interest", "rising_searches")
+
+def _normalize_keywords(keywords: Union[str, List[str]]) -> List[str]:
+    """Stripped, non-empty, de-duplicated keywords, at most 5 for API constraints."""
+    if isinstance(keywords, str):
+        keywords = [keywords]
+    stripped = (keyword.strip() for keyword in keywords if keyword and keyword.strip())
+    return list(dict.fromkeys(stripped))[:5]
+
+def _cache_key(keywords, *options) -> tuple:
+    """Canonical cache key, keywords normalized the same way _analyze does."""
+    return (tuple(_normalize_keywords(keywords)),) + options
+
+def _disk_key(key: tuple) -> str:
+    return hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+
+def _is_historical(timeframe: str) -> bool:
+    """True for explicit 'start end' date ranges that ended before today."""
+    parts = timeframe.split()
+    if len(parts) != 2:
+        return False
+    try:
+        end = datetime.strptime(parts[1][:10], '%Y-%m-%d').date()
+    except ValueError:
+        return False
+    return end < datetime.now().date()
+
+def _cache_get(key: tuple) -> Optional[str]:
+    with _result_cache_lock:
+        entry = _result_cache.get(key)
+    if entry is None and _disk_cache is not None:
+        entry = _disk_cache.get(_disk_key(key))
+        if entry is not None:
+            with _result_cache_lock:
+                _result_cache[key] = entry
+    with _result_cache_lock:
+        _cache_stats["hits" if entry else "misses"] += 1
+    logger.debug("Trends cache %s for %s", "HIT" if entry else "MISS", key)
+    return entry[0] if entry else None
+
+def _cache_put(key: tuple, timeframe: str, output: str, richness: int) -> None:
+    # A concurrent run of the same query may finish first, keep whichever found more data
+    with _result_cache_lock:
+        entry = _result_cache.get(key)
+        if entry is not None and entry[1] > richness:
+            return
+        _result_cache[key] = (output, richness)
+    
+    if _disk_cache is not None:
+        _disk_cache.set(_disk_key(key), (output, richness),
+                        expire=None if _is_historical(timeframe) else TRENDS_CACHE_TTL)
+
+# Queries that were analysed successfully are re-analysed in the background for a
+# day after they were last requested, so agents coming back to the same hot topics
+# find a fresh result waiting. Between passes the disk cache serves them.
+WARM_REFRESH_INTERVAL = 30 * 60
+WARM_KEY_LIFETIME = 24 * 60 * 60
+_warm_keys: Dict[tuple, float] = {}
+_warm_lock = threading.Lock()
+_warmer: Optional[threading.Thread] = None
+
+def _mark_warm(key: tuple) -> None:
+    """Record a request for a key and start the refresh thread on first use."""
+    global _warmer
+    with _warm_lock:
+        _warm_keys[key] = time.monotonic()
+        if _warmer is None:
+            _warmer = threading.Thread(target=_refresh_warm_keys, name="trends-cache-warmer", daemon=True)
+            _warmer.start()
+
+def _refresh_warm_keys() -> None:
+    while True:
+        time.sleep(WARM_REFRESH_INTERVAL)
+        
+        now = time.monotonic()
+        with _warm_lock:
+            for key in [key for key, requested in _warm_keys.items() if now - requested > WARM_KEY_LIFETIME]:
+                del _warm_keys[key]
+            keys = list(_warm_keys)
+        
+        tool = AdvancedGoogleTrendsAnalyzer()
+        for key in keys:
+            try:
+                tool._compute(key)
+            except Exception as e:
+                logger.warning("Could not refresh trends for %s: %s", key[0], e)
+
+# Widget tokens from build_payload, restored for the same query instead of asking
+# Google again. Tokens go stale, so they are only kept for a few minutes.
+PAYLOAD_CACHE_SIZE = 128
+PAYLOAD_CACHE_TTL = 10 * 60
+_PAYLOAD_ATTRS = ("kw_list", "geo", "token_payload", "interest_over_time_widget", "interest_by_region_widget",
+                  "related_topics_widget_list", "related_queries_widget_list")
+_payload_cache = TTLCache(maxsize=PAYLOAD_CACHE_SIZE, ttl=PAYLOAD_CACHE_TTL)
+
+def _build_payload(pytrends: TrendReq, kw_list: List[str], cat: int, timeframe: str, geo: str, gprop: str) -> None:
+    """build_payload that reuses the tokens of a recent identical query; call with _client_lock held."""
+    key = (tuple(kw_list), cat, timeframe, geo, gprop)
+    state = _payload_cache.get(key)
+    if state is None:
+        _rate_limited(pytrends.build_payload, kw_list=kw_list, cat=cat, timeframe=timeframe, geo=geo, gprop=gprop)
+        # pytrends edits the widget lists and dicts in place, so the cache keeps its own copies
+        _payload_cache[key] = copy.deepcopy({attr: getattr(pytrends, attr) for attr in _PAYLOAD_ATTRS})
+    else:
+        for attr, value in copy.deepcopy(state).items():
+            setattr(pytrends, attr, value)
+
 class GoogleTrendsInput(BaseModel):
     """Input schema for Google Trends analysis."""
     keywords: Union[str, List[str]] = Field(
@@ -43,6 +294,10 @@ class GoogleTrendsInput(BaseModel):
         default=True, 
         description="Include rising searches analysis"
     )
+    include_interest: bool = Field(
+        default=True, 
+        description="Include interest over time for the keywords"
+    )
 
 class AdvancedGoogleTrendsAnalyzer(BaseTool):
     name: str = "Advanced Google Trends Analyzer"
@@ -67,7 +322,8 @@ class AdvancedGoogleTrendsAnalyzer(BaseTool):
              gprop: str = "",
              include_related: bool = True,
              include_regional: bool = True,
-             include_rising: bool = True) -> str:
+             include_rising: bool = True,
+             include_interest: bool = True) -> str:
         """
         Execute comprehensive Google Trends analysis.
         
@@ -80,29 +336,97 @@ class AdvancedGoogleTrendsAnalyzer(BaseTool):
             include_related: Whether to include related topics/queries
             include_regional: Whether to include regional breakdown
             include_rising: Whether to include rising searches
+            include_interest: Whether to include interest over time
             
         Returns:
             JSON string with comprehensive trends analysis
         """
+        key = _cache_key(keywords, timeframe, geo, category, gprop,
+                         include_related, include_regional, include_rising, include_interest)
+        
+        # Nothing to analyse, don't spend a request on Google rejecting the payload
+        if not key[0]:
+            return _dump({
+                "error": "Analysis failed: no keywords given",
+                "keywords": keywords,
+                "timestamp": datetime.now().isoformat()
+            })
+        
+        cached = _cache_get(key)
+        if cached is not None:
+            _mark_warm(key)
+            return cached
+
+        return self._compute(key, warm=True)
+
+    def _compute(self, key: tuple, warm: bool = False) -> str:
+        """Run the analysis described by a cache key, store its result and optionally keep it warm."""
+        keywords, timeframe, *options = key
+        with _client_lock:
+            result = self._analyze(list(keywords), timeframe, *options)
+
+        # Failed analyses are neither cached nor refreshed, so the next call retries them
+        if "error" in result:
+            return _dump(result)
+
+        output = _dump(result)
+        _cache_put(key, timeframe, output, sum(bool(result[section]) for section in _DATA_SECTIONS))
+        if warm:
+            _mark_warm(key)
+        return output
+
+    @staticmethod
+    def cache_stats() -> Dict[str, Any]:
+        """Hit/miss counters of the analysis cache and the number of warm keys"""
+        with _result_cache_lock:
+            hits, misses = _cache_stats["hits"], _cache_stats["misses"]
+        with _warm_lock:
+            warm = len(_warm_keys)
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / total if total else 0.0,
+            "warm_keys": warm
+        }
+
+    def _analyze(self, keywords, timeframe, geo, category, gprop,
+                 include_related, include_regional, include_rising, include_interest) -> Dict[str, Any]:
+        """Run the analysis on the shared client; the caller holds _client_lock."""
         try:
-            # Initialize pytrends and logger within the method
-            pytrends = TrendReq(hl='en-US', tz=360, retries=3, backoff_factor=0.5)
-            logger = logging.getLogger(__name__)
+            # Shared pytrends client
+            pytrends = _get_client()
             
             # Normalize keywords to list
-            if isinstance(keywords, str):
-                kw_list = [keywords]
-            else:
-                kw_list = keywords[:5]  # Limit to 5 keywords for API constraints
+            kw_list = _normalize_keywords(keywords)
             
-            # Build payload for pytrends
-            pytrends.build_payload(
-                kw_list=kw_list,
-                cat=category,
-                timeframe=timeframe,
-                geo=geo,
-                gprop=gprop
-            )
+            # Build payload for pytrends, trending searches are the only report that doesn't need it
+            if include_interest or include_related or include_regional:
+                _build_payload(
+                    pytrends,
+                    kw_list=kw_list,
+                    cat=category,
+                    timeframe=timeframe,
+                    geo=geo,
+                    gprop=gprop
+                )
+            
+            # The reports below only read the payload built above, so they are
+            # requested side by side. Related topics/queries cover every keyword at once.
+            reports = {}
+            if include_interest:
+                reports["interest_over_time"] = pytrends.interest_over_time
+            if include_related:
+                reports["related_topics"] = pytrends.related_topics
+                reports["related_queries"] = pytrends.related_queries
+            if include_regional:
+                reports["regional_interest"] = partial(pytrends.interest_by_region, resolution='COUNTRY')
+            if include_rising:
+                # This uses trending searches which might not be available for all regions
+                reports["rising_searches"] = partial(pytrends.trending_searches, pn='united_states')
+            
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+                futures = {name: executor.submit(_rate_limited, fetch) for name, fetch in reports.items()}
             
             analysis_result = {
                 "query_info": {
@@ -122,77 +446,73 @@ class AdvancedGoogleTrendsAnalyzer(BaseTool):
             }
             
             # Get interest over time
-            try:
-                interest_df = pytrends.interest_over_time()
-                if not interest_df.empty:
-                    # Remove 'isPartial' column if it exists
-                    if 'isPartial' in interest_df.columns:
-                        interest_df = interest_df.drop('isPartial', axis=1)
-                    
-                    analysis_result["interest_over_time"] = {
-                        "data": interest_df.to_dict('records'),
-                        "peak_periods": self._find_peak_periods(interest_df),
-                        "trend_direction": self._analyze_trend_direction(interest_df),
-                        "average_interest": interest_df.mean().to_dict()
-                    }
-                time.sleep(1)  # Rate limiting
-            except Exception as e:
-                logger.warning(f"Could not retrieve interest over time: {str(e)}")
+            if include_interest:
+                try:
+                    interest_df = futures["interest_over_time"].result()
+                    if not interest_df.empty:
+                        # Remove 'isPartial' column if it exists, the helpers below expect keyword columns only
+                        interest_df = interest_df.drop(columns='isPartial', errors='ignore')
+                        
+                        analysis_result["interest_over_time"] = {
+                            # Dates formatted once for the whole index, plus one numpy
+                            # series per keyword that orjson writes natively
+                            "data": {
+                                "dates": interest_df.index.strftime(_date_format(interest_df.index)).tolist(),
+                                # orjson needs C-contiguous arrays, a column of a frame built
+                                # from one 2D block is a strided view
+                                "series": {column: np.ascontiguousarray(interest_df[column].to_numpy())
+                                           for column in interest_df.columns}
+                            },
+                            "peak_periods": self._find_peak_periods(interest_df),
+                            "trend_direction": self._analyze_trend_direction(interest_df),
+                            "average_interest": interest_df.mean().to_dict()
+                        }
+                except Exception as e:
+                    logger.warning("Could not retrieve %s: %s", "interest over time", e)
             
             # Get related topics and queries for each keyword
             if include_related:
-                for keyword in kw_list:
+                for section in ("related_topics", "related_queries"):
                     try:
-                        # Related topics
-                        related_topics = pytrends.related_topics()
-                        if keyword in related_topics and related_topics[keyword] is not None:
-                            analysis_result["related_topics"][keyword] = {
-                                "top": self._process_related_data(related_topics[keyword].get('top')),
-                                "rising": self._process_related_data(related_topics[keyword].get('rising'))
-                            }
-                        
-                        time.sleep(1)  # Rate limiting
-                        
-                        # Related queries
-                        related_queries = pytrends.related_queries()
-                        if keyword in related_queries and related_queries[keyword] is not None:
-                            analysis_result["related_queries"][keyword] = {
-                                "top": self._process_related_data(related_queries[keyword].get('top')),
-                                "rising": self._process_related_data(related_queries[keyword].get('rising'))
-                            }
-                        
-                        time.sleep(1)  # Rate limiting
-                        
+                        related = futures[section].result()
                     except Exception as e:
-                        logger.warning(f"Could not retrieve related data for {keyword}: {str(e)}")
+                        logger.warning("Could not retrieve %s: %s", section.replace('_', ' '), e)
+                        continue
+                    
+                    for keyword in kw_list:
+                        if keyword in related and related[keyword] is not None:
+                            analysis_result[section][keyword] = {
+                                "top": self._process_related_data(related[keyword].get('top')),
+                                "rising": self._process_related_data(related[keyword].get('rising'))
+                            }
             
             # Get regional interest
             if include_regional:
                 try:
-                    regional_df = pytrends.interest_by_region(resolution='COUNTRY')
+                    regional_df = futures["regional_interest"].result()
                     if not regional_df.empty:
                         analysis_result["regional_interest"] = {
                             "by_country": regional_df.to_dict('index'),
                             "top_regions": self._get_top_regions(regional_df)
                         }
-                    time.sleep(1)  # Rate limiting
                 except Exception as e:
-                    logger.warning(f"Could not retrieve regional interest: {str(e)}")
+                    logger.warning("Could not retrieve %s: %s", "regional interest", e)
             
             # Get rising searches if requested
             if include_rising:
                 try:
-                    # This uses trending searches which might not be available for all regions
-                    trending_searches = pytrends.trending_searches(pn='united_states')
-                    if not trending_searches.empty:
-                        analysis_result["rising_searches"]["trending_now"] = trending_searches[0].head(10).tolist()
+                    # Single-column frame, take the first ten entries straight out as a list
+                    trending_searches = futures["rising_searches"].result()
+                    trending_now = trending_searches.iloc[:10, 0].tolist() if len(trending_searches) else []
+                    if trending_now:
+                        analysis_result["rising_searches"]["trending_now"] = trending_now
                 except Exception as e:
-                    logger.warning(f"Could not retrieve rising searches: {str(e)}")
+                    logger.warning("Could not retrieve %s: %s", "rising searches", e)
             
             # Generate summary insights
             analysis_result["summary"] = self._generate_summary(analysis_result, kw_list)
             
-            return json.dumps(analysis_result, indent=2, default=str)
+            return analysis_result
             
         except Exception as e:
             error_result = {
@@ -200,76 +520,84 @@ class AdvancedGoogleTrendsAnalyzer(BaseTool):
                 "keywords": kw_list if 'kw_list' in locals() else keywords,
                 "timestamp": datetime.now().isoformat()
             }
-            return json.dumps(error_result, indent=2)
+            return error_result
     
     def _process_related_data(self, data) -> List[Dict]:
         """Process related topics/queries data."""
         if data is None or data.empty:
             return []
         
-        # Convert to list of dictionaries
-        result = []
-        for _, row in data.head(10).iterrows():  # Limit to top 10
-            if 'topic_title' in row:  # Related topics
-                result.append({
+        # Convert to list of dictionaries, the schema is the same for every row
+        rows = data.head(10).to_dict('records')  # Limit to top 10
+        if 'topic_title' in data.columns:  # Related topics
+            return [
+                {
                     "title": row.get('topic_title', ''),
                     "type": row.get('topic_type', ''),
                     "value": row.get('value', 0)
-                })
-            else:  # Related queries
-                result.append({
-                    "query": row.get('query', ''),
-                    "value": row.get('value', 0)
-                })
-        return result
+                } for row in rows
+            ]
+        
+        # Related queries
+        return [{"query": row.get('query', ''), "value": row.get('value', 0)} for row in rows]
     
     def _find_peak_periods(self, df) -> Dict:
         """Identify peak periods in the data."""
+        # One DataFrame-wide pass each for the peak positions and values
+        peak_dates = df.idxmax()
+        peak_values = df.max()
+        
+        # Format every peak date in one vectorised call when the index holds dates
+        if pd.api.types.is_datetime64_any_dtype(peak_dates):
+            peak_dates = peak_dates.dt.strftime(_date_format(df.index))
+        else:
+            peak_dates = peak_dates.astype(str)
+        
+        # Values stay numpy floats, orjson writes them without Python float boxing
         peaks = {}
-        for column in df.columns:
-            if column != 'isPartial':
-                max_idx = df[column].idxmax()
-                max_value = df[column].max()
-                peaks[column] = {
-                    "peak_date": max_idx.strftime('%Y-%m-%d') if hasattr(max_idx, 'strftime') else str(max_idx),
-                    "peak_value": float(max_value)
-                }
+        for column, peak_date, max_value in zip(df.columns, peak_dates.tolist(), peak_values.to_numpy(dtype=np.float64)):
+            peaks[column] = {
+                "peak_date": peak_date,
+                "peak_value": max_value
+            }
         return peaks
     
     def _analyze_trend_direction(self, df) -> Dict:
         """Analyze overall trend direction."""
+        # Calculate trend using first and last 10% of data, for every column at once
+        window = max(1, len(df) // 10)
+        start_avg = df.head(window).mean().to_numpy(dtype=np.float64)
+        end_avg = df.tail(window).mean().to_numpy(dtype=np.float64)
+        
+        directions = np.select(
+            [end_avg > start_avg * 1.1, end_avg < start_avg * 0.9],
+            ["Rising", "Declining"],
+            default="Stable"
+        )
+        with np.errstate(divide='ignore', invalid='ignore'):
+            changes = np.where(start_avg > 0, (end_avg - start_avg) / start_avg * 100, 0)
+        
         trends = {}
-        for column in df.columns:
-            if column != 'isPartial':
-                # Calculate trend using first and last 10% of data
-                data_length = len(df)
-                start_avg = df[column].head(max(1, data_length // 10)).mean()
-                end_avg = df[column].tail(max(1, data_length // 10)).mean()
-                
-                if end_avg > start_avg * 1.1:
-                    direction = "Rising"
-                elif end_avg < start_avg * 0.9:
-                    direction = "Declining"
-                else:
-                    direction = "Stable"
-                
-                trends[column] = {
-                    "direction": direction,
-                    "start_average": float(start_avg),
-                    "end_average": float(end_avg),
-                    "change_percentage": float((end_avg - start_avg) / start_avg * 100) if start_avg > 0 else 0
-                }
+        for column, direction, start, end, change in zip(
+                df.columns, directions.tolist(), start_avg, end_avg, changes):
+            trends[column] = {
+                "direction": direction,
+                "start_average": start,
+                "end_average": end,
+                "change_percentage": change if start > 0 else 0
+            }
         return trends
     
     def _get_top_regions(self, df) -> Dict:
         """Get top regions for each keyword."""
         top_regions = {}
         for column in df.columns:
-            # Sort by values and get top 10
-            top_10 = df[column].sort_values(ascending=False).head(10)
+            # Partial selection of the top 10 regions with any interest, no full sort
+            values = df[column]
+            top_10 = values[values > 0].nlargest(10)
             top_regions[column] = [
-                {"region": region, "interest": float(value)} 
-                for region, value in top_10.items() if value > 0
+                {"region": region, "interest": value} 
+                for region, value in zip(top_10.index.tolist(), top_10.to_numpy(dtype=np.float64))
             ]
         return top_regions
     